@@ -25,7 +25,6 @@ Version: 2.0
 
 import struct
 import sys
-import zlib
 import mmap
 import os
 import tkinter as tk
@@ -33,12 +32,90 @@ from tkinter import ttk, filedialog, messagebox
 from pathlib import Path
 from PIL import Image, ImageTk
 import threading
+import queue
 import pickle
 import time
+import math
 import io
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import OrderedDict
+
+# Prefer ISA-L or zlib-ng for inflate when installed; both mirror the zlib API
+try:
+    from isal import isal_zlib as _zlib
+except ImportError:
+    try:
+        from zlib_ng import zlib_ng as _zlib
+    except ImportError:
+        import zlib as _zlib
 
 VERSION = "2.0"
 
+# Precompiled little-endian readers for stub archive parsing
+_U32 = struct.Struct('<I')
+_U16 = struct.Struct('<H')
+_ENTRY = struct.Struct('<II')
+
+# DAT image header (32 bytes): type, flags, unk 02, unk 04, data size, width,
+# height, format flag, unk 14, unk 18, chroma flag, unk 1E
+_HDR = struct.Struct('<BBHIIHHIIIHH')
+
+# Header fields checked by the scanner: data size, width, height, format flag, chroma flag
+_VAL = struct.Struct('<8xIHHI8xH2x')
+
+# Byte translation table for hex dump text: printable ASCII kept, everything else '.'
+_PRINTABLE = bytes(c if 32 <= c < 127 else 46 for c in range(256))
+
+# Image list format column, keyed by (color key flag set, format flag set)
+_FORMAT_LABELS = {
+    (False, False): "STD",
+    (True, False): "CK",
+    (False, True): "FL",
+    (True, True): "CK+FL",
+}
+
+# Archive tree name prefixes by file extension
+_ARCHIVE_TAGS = {
+    '.dll': 'bin',
+    '.exe': 'bin',
+    '.ift': 'ext',
+    '.mfx': 'ext',
+    '.mvx': 'app',
+    '.ccn': 'app',
+}
+
+
+def _dims_plausible(w, h):
+    """Check that width and height are in the range used by DAT images"""
+    return 2 <= w <= 8192 and 2 <= h <= 8192
+
+
+def _read_chunks(f, size, chunk):
+    """Yield up to size bytes from f in pieces of at most chunk bytes"""
+    while size > 0:
+        buf = f.read(min(chunk, size))
+        if not buf:
+            return
+        size -= len(buf)
+        yield buf
+
+
+def _is_dat_header(ds, w, h, actual_data):
+    """Check a decompressed candidate against the DAT size heuristics"""
+    if not _dims_plausible(w, h):
+        return False
+    
+    # Header data size or actual payload within 30% of a BGR or BGRA plane,
+    # kept in integer arithmetic (10 * diff <= 3 * expected)
+    expected_bgr = w * h * 3
+    expected_bgra = w * h * 4
+    return (10 * abs(ds - expected_bgr) <= 3 * expected_bgr or
+            10 * abs(ds - expected_bgra) <= 3 * expected_bgra or
+            10 * abs(actual_data - expected_bgr) <= 3 * expected_bgr or
+            10 * abs(actual_data - expected_bgra) <= 3 * expected_bgra)
+
+
 class DATImage:
     """Parser for custom DAT image format with full header analysis"""
     HEADER_SIZE = 32
@@ -75,21 +152,11 @@ class DATImage:
         if len(self.data) < self.HEADER_SIZE:
             raise ValueError("Data too small for DAT header")
         
-        header = self.raw_header
-        
         # Parse all header fields
-        self.type_id = header[0]
-        self.flags = header[1]
-        self.unknown_02 = struct.unpack('<H', header[0x02:0x04])[0]
-        self.unknown_04 = struct.unpack('<I', header[0x04:0x08])[0]
-        self.data_size = struct.unpack('<I', header[0x08:0x0C])[0]
-        self.width = struct.unpack('<H', header[0x0C:0x0E])[0]
-        self.height = struct.unpack('<H', header[0x0E:0x10])[0]
-        self.format_flag = struct.unpack('<I', header[0x10:0x14])[0]
-        self.unknown_14 = struct.unpack('<I', header[0x14:0x18])[0]
-        self.unknown_18 = struct.unpack('<I', header[0x18:0x1C])[0]
-        self.chroma_flag = struct.unpack('<H', header[0x1C:0x1E])[0]
-        self.unknown_1E = struct.unpack('<H', header[0x1E:0x20])[0]
+        (self.type_id, self.flags, self.unknown_02, self.unknown_04,
+         self.data_size, self.width, self.height, self.format_flag,
+         self.unknown_14, self.unknown_18, self.chroma_flag,
+         self.unknown_1E) = _HDR.unpack_from(self.data)
         
         if self.width == 0 or self.height == 0:
             raise ValueError(f"Invalid dimensions: {self.width}x{self.height}")
@@ -139,7 +206,9 @@ class DATImage:
         # Flip disabled by default - user can toggle
         self.needs_flip = False
         
-        self.pixel_data = self.data[self.HEADER_SIZE:]
+        # Zero-copy view of the pixel planes; row padding is skipped by the
+        # decoder's stride rather than by slicing rows out
+        self.pixel_data = memoryview(self.data)[self.HEADER_SIZE:]
     
     def get_header_info(self):
         """Return formatted header information"""
@@ -176,56 +245,67 @@ class DATImage:
     
     def to_pil_image(self, force_flip=None):
         """Convert to PIL Image with optional flip override"""
-        img = Image.new('RGBA', (self.width, self.height))
-        pixels = img.load()
+        width, height = self.width, self.height
         data = self.pixel_data
         
         # Calculate BGR data size using stride (for row-aligned formats)
         bgr_stride = getattr(self, 'bgr_stride', self.actual_width * 3)
-        bgr_size = bgr_stride * self.height
+        bgr_size = bgr_stride * height
+        
+        # Apply flip by reading rows bottom-up rather than transposing afterwards
+        do_flip = force_flip if force_flip is not None else self.needs_flip
+        orientation = -1 if do_flip else 1
         
         if self.has_planar_alpha and len(data) > bgr_size:
             # Planar format: BGR data (row-aligned) followed by Alpha plane (row-aligned)
-            bgr_data = data[:bgr_size]
-            alpha_data = data[bgr_size:]
-            alpha_stride = self.alpha_stride if self.alpha_stride > 0 else self.width
-            
-            for y in range(self.height):
-                bgr_row_start = y * bgr_stride
-                alpha_row_start = y * alpha_stride
-                for x in range(self.width):
-                    bgr_idx = bgr_row_start + x * 3
-                    if bgr_idx + 3 <= len(bgr_data):
-                        b, g, r = bgr_data[bgr_idx], bgr_data[bgr_idx+1], bgr_data[bgr_idx+2]
-                    else:
-                        r, g, b = 0, 0, 0
-                    
-                    alpha_idx = alpha_row_start + x
-                    a = alpha_data[alpha_idx] if alpha_idx < len(alpha_data) else 255
-                    pixels[x, y] = (r, g, b, a)
-        else:
-            # Chroma key format (no separate alpha)
-            chroma_key = self.chroma_key or (0, 0, 0)
+            alpha_stride = self.alpha_stride if self.alpha_stride > 0 else width
+            alpha_size = alpha_stride * height
+            alpha_data = memoryview(data)[bgr_size:bgr_size + alpha_size]
+            if len(alpha_data) < alpha_size:
+                # Missing alpha bytes default to opaque
+                alpha_data = bytes(alpha_data) + b'\xff' * (alpha_size - len(alpha_data))
             
-            for y in range(self.height):
-                row_start = y * bgr_stride
-                for x in range(self.width):
-                    idx = row_start + x * 3
-                    if idx + 3 <= len(data):
-                        b, g, r = data[idx], data[idx+1], data[idx+2]
-                        if (r, g, b) == chroma_key:
-                            pixels[x, y] = (0, 0, 0, 0)
-                        else:
-                            pixels[x, y] = (r, g, b, 255)
-                    else:
-                        pixels[x, y] = (0, 0, 0, 0)
-        
-        # Apply flip
-        do_flip = force_flip if force_flip is not None else self.needs_flip
+            # PIL's raw decoder strips row padding and swaps BGR -> RGB in C
+            img = Image.frombuffer('RGBA', (width, height), data, 'raw', 'BGR', bgr_stride, orientation)
+            img.putalpha(Image.frombuffer('L', (width, height), alpha_data, 'raw', 'L', alpha_stride, orientation))
+            return img
+        
+        # Chroma key format (no separate alpha)
+        chroma_key = self.chroma_key or (0, 0, 0)
+        
+        # Pad truncated pixel data so the rows can be reshaped;
+        # pixels that were not fully present are masked out below
+        if len(data) < bgr_size:
+            data = bytes(data) + bytes(bgr_size - len(data))
+        
+        # View the BGR rows without their padding and assemble RGBA in one
+        # preallocated array, with no intermediate image to copy out of
+        bgr = np.frombuffer(data, dtype=np.uint8, count=bgr_size).reshape(height, bgr_stride)
+        bgr = bgr[:, :width * 3].reshape(height, width, 3)
         if do_flip:
-            img = img.transpose(Image.FLIP_TOP_BOTTOM)
-        
-        return img
+            bgr = bgr[::-1]
+        
+        rgba = np.empty((height, width, 4), dtype=np.uint8)
+        rgba[..., 0] = bgr[..., 2]
+        rgba[..., 1] = bgr[..., 1]
+        rgba[..., 2] = bgr[..., 0]
+        rgba[..., 3] = 255
+        
+        # Compare whole pixels as packed 32-bit words (alpha is always 255 here)
+        pixels = rgba.view(np.uint32)[..., 0]
+        key = np.array(tuple(chroma_key) + (255,), dtype=np.uint8).view(np.uint32)[0]
+        transparent = pixels == key
+        
+        if len(self.pixel_data) < bgr_size:
+            # Pixels cut off by the end of the data are fully transparent
+            pixel_end = np.arange(height)[:, None] * bgr_stride + np.arange(width) * 3 + 3
+            missing = pixel_end > len(self.pixel_data)
+            transparent |= missing[::-1] if do_flip else missing
+        
+        # Clear transparent pixels with a branch-free multiply; a masked
+        # store is several times slower on scattered masks
+        pixels *= ~transparent
+        return Image.fromarray(rgba)
 
 
 class StubArchive:
@@ -239,26 +319,33 @@ class StubArchive:
     def scan(self):
         """Scan for and parse the stub archive"""
         with open(self.filepath, 'rb') as f:
-            data = f.read()
-        
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        mv = memoryview(mm)
+        try:
+            return self._parse(mm, mv)
+        finally:
+            mv.release()
+            mm.close()
+    
+    def _parse(self, mm, mv):
+        """Parse the stub archive directly from the mapped file (zero-copy views)"""
         # Find PE overlay
-        pe_offset = struct.unpack('<I', data[0x3C:0x40])[0]
-        num_sections = struct.unpack('<H', data[pe_offset+6:pe_offset+8])[0]
-        opt_header_size = struct.unpack('<H', data[pe_offset+20:pe_offset+22])[0]
+        pe_offset = _U32.unpack_from(mv, 0x3C)[0]
+        num_sections = _U16.unpack_from(mv, pe_offset + 6)[0]
+        opt_header_size = _U16.unpack_from(mv, pe_offset + 20)[0]
         
         section_table = pe_offset + 24 + opt_header_size
         max_end = 0
         
         for i in range(num_sections):
-            raw_size = struct.unpack('<I', data[section_table + i*40 + 16:section_table + i*40 + 20])[0]
-            raw_ptr = struct.unpack('<I', data[section_table + i*40 + 20:section_table + i*40 + 24])[0]
+            raw_size, raw_ptr = _ENTRY.unpack_from(mv, section_table + i*40 + 16)
             max_end = max(max_end, raw_ptr + raw_size)
         
         overlay_start = max_end
         
         # Find 77 77 77 77 signature
         sig = bytes([0x77, 0x77, 0x77, 0x77])
-        sig_pos = data.find(sig, overlay_start)
+        sig_pos = mm.find(sig, overlay_start)
         
         if sig_pos == -1:
             return []
@@ -266,35 +353,32 @@ class StubArchive:
         self.archive_offset = sig_pos
         
         # Parse header
-        header_size = struct.unpack('<I', data[sig_pos + 8:sig_pos + 12])[0]
-        file_count = struct.unpack('<I', data[sig_pos + 0x1C:sig_pos + 0x20])[0]
+        header_size = _U32.unpack_from(mv, sig_pos + 8)[0]
+        file_count = _U32.unpack_from(mv, sig_pos + 0x1C)[0]
         
         # Parse file entries
         pos = sig_pos + header_size
+        data_len = len(mm)
         self.files = []
         
         for i in range(file_count):
-            if pos + 2 > len(data):
+            if pos + 2 > data_len:
                 break
             
-            name_len = struct.unpack('<H', data[pos:pos+2])[0]
+            name_len = _U16.unpack_from(mv, pos)[0]
             pos += 2
             
-            if pos + name_len * 2 > len(data):
+            if pos + name_len * 2 > data_len:
                 break
             
-            name_bytes = data[pos:pos + name_len * 2]
-            try:
-                filename = name_bytes.decode('utf-16le').rstrip('\x00')
-            except:
-                filename = f"file_{i}"
+            # Undecodable names (e.g. lone surrogates) get U+FFFD rather than a placeholder
+            filename = str(mv[pos:pos + name_len * 2], 'utf-16-le', 'replace').rstrip('\x00')
             pos += name_len * 2
             
-            if pos + 8 > len(data):
+            if pos + 8 > data_len:
                 break
             
-            crc = struct.unpack('<I', data[pos:pos+4])[0]
-            compressed_size = struct.unpack('<I', data[pos+4:pos+8])[0]
+            crc, compressed_size = _ENTRY.unpack_from(mv, pos)
             pos += 8
             
             data_offset = pos
@@ -323,13 +407,75 @@ class StubArchive:
             compressed = f.read(file_info['compressed_size'])
         
         try:
-            return zlib.decompress(compressed)
+            return _zlib.decompress(compressed)
         except:
             return compressed  # Return raw if decompression fails
+    
+    def extract_file_to(self, out_path, index, chunk=1 << 20):
+        """Decompress a file by index straight to out_path, returning bytes written"""
+        if index >= len(self.files):
+            return 0
+        
+        file_info = self.files[index]
+        offset = file_info['data_offset']
+        size = file_info['compressed_size']
+        
+        out = None
+        
+        def emit(data):
+            # The output is created on the first non-empty piece, so entries
+            # with no data leave no file behind
+            nonlocal out
+            if out is None:
+                out = open(out_path, 'wb')
+            out.write(data)
+        
+        try:
+            with open(self.filepath, 'rb') as src:
+                src.seek(offset)
+                decompressor = _zlib.decompressobj()
+                written = 0
+                try:
+                    for buf in _read_chunks(src, size, chunk):
+                        # Bound each output piece so memory stays at one chunk, and
+                        # keep draining until the inflater has no pending output left
+                        while not decompressor.eof:
+                            piece = decompressor.decompress(buf, chunk)
+                            buf = decompressor.unconsumed_tail
+                            if not piece and not buf:
+                                break
+                            if piece:
+                                emit(piece)
+                                written += len(piece)
+                        if decompressor.eof:
+                            break
+                    complete = decompressor.eof
+                except _zlib.error:
+                    complete = False
+                
+                if complete:
+                    return written
+                
+                # Write raw if decompression fails, matching extract_file
+                src.seek(offset)
+                if out is not None:
+                    out.seek(0)
+                    out.truncate()
+                written = 0
+                for buf in _read_chunks(src, size, chunk):
+                    emit(buf)
+                    written += len(buf)
+                return written
+        finally:
+            if out is not None:
+                out.close()
 
 
 class ImageScanner:
     """Fast scanner for DAT images in Clickteam EXE files"""
+    PROBE_SIZE = 512  # Compressed bytes fed to the header probe
+    BATCH_SIZE = 500  # Candidates validated per worker task
+    SCAN_BLOCK_SIZE = 16 << 20  # Bytes searched per phase 1 block
     
     def __init__(self, filepath):
         self.filepath = filepath
@@ -338,6 +484,30 @@ class ImageScanner:
         self.status = ""
         self.complete = False
         self.cancelled = False
+        
+        # Read-only mapping kept open for image extraction
+        self._mm = None
+        self._mm_lock = threading.Lock()
+    
+    def open_mmap(self):
+        """Return the file mapping used for extraction, opening it on first use"""
+        with self._mm_lock:
+            if self._mm is None:
+                with open(self.filepath, 'rb') as f:
+                    self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            return self._mm
+    
+    def close(self):
+        """Release the file mapping"""
+        with self._mm_lock:
+            if self._mm is not None:
+                try:
+                    self._mm.close()
+                except BufferError:
+                    # A decompress still holds a view of the mapping; dropping our
+                    # reference lets it be unmapped once that view is released
+                    pass
+                self._mm = None
     
     def scan(self, progress_callback=None):
         """Scan the EXE for all DAT images"""
@@ -358,92 +528,132 @@ class ImageScanner:
             if progress_callback:
                 progress_callback(0, "Finding compressed data blocks...")
             
+            # Search the mapped file in large blocks, reporting progress once per block
             zlib_headers = []
-            pos = start_offset
+            arr = np.frombuffer(mm, dtype=np.uint8)
+            scan_end = max(start_offset, file_size - 10)
             
-            while not self.cancelled:
-                pos = mm.find(b'\x78', pos)
-                if pos == -1 or pos >= file_size - 10:
+            for block_start in range(start_offset, scan_end, self.SCAN_BLOCK_SIZE):
+                if self.cancelled:
                     break
                 
-                next_byte = mm[pos + 1]
-                if next_byte in [0x01, 0x5E, 0x9C, 0xDA]:
-                    if (0x78 * 256 + next_byte) % 31 == 0:
-                        zlib_headers.append(pos)
+                block_end = min(block_start + self.SCAN_BLOCK_SIZE, scan_end)
+                zlib_headers.extend(self._find_zlib_headers(arr, block_start, block_end))
                 
-                pos += 1
-                
-                if len(zlib_headers) % 5000 == 0 and progress_callback:
-                    pct = min(25, int((pos - start_offset) * 25 / (file_size - start_offset)))
+                if progress_callback:
+                    pct = int((block_end - start_offset) * 25 / (scan_end - start_offset))
                     progress_callback(pct, f"Finding blocks... {len(zlib_headers):,} found")
             
+            # Drop the view so the mmap can be closed later
+            del arr
+            
             if self.cancelled:
                 mm.close()
                 return []
             
-            # Phase 2: Test each zlib block for DAT image
+            # Phase 2: Test each zlib block for DAT image. zlib releases the GIL
+            # while inflating, so batches are validated on a thread pool that
+            # shares the read-only mapping.
             total_headers = len(zlib_headers)
+            batches = [zlib_headers[i:i + self.BATCH_SIZE]
+                       for i in range(0, total_headers, self.BATCH_SIZE)]
+            results = [None] * len(batches)
+            checked = 0
+            found = 0
+            
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                futures = {executor.submit(self._validate_offsets, mm, batch): n
+                           for n, batch in enumerate(batches)}
+                
+                for future in as_completed(futures):
+                    n = futures[future]
+                    results[n] = future.result()
+                    checked += len(batches[n])
+                    found += len(results[n])
+                    
+                    if progress_callback:
+                        pct = 25 + int(checked * 75 / total_headers)
+                        progress_callback(pct, f"Analyzing {checked:,}/{total_headers:,} blocks... {found} images found")
+            
+            # Keep images in file order regardless of completion order
+            for batch_images in results:
+                self.images.extend(batch_images)
             
-            for i, zpos in enumerate(zlib_headers):
+            mm.close()
+        
+        self.complete = True
+        elapsed = time.time() - start_time
+        
+        if progress_callback:
+            progress_callback(100, f"Complete! Found {len(self.images)} images in {elapsed:.1f}s")
+        
+        return self.images
+    
+    def _find_zlib_headers(self, arr, start, end):
+        """Return offsets in [start, end) that look like zlib stream headers"""
+        # Locate every 0x78 CMF byte, then check the FLG byte only at those
+        # hits. The four accepted headers (78 01, 78 5E, 78 9C, 78 DA)
+        # already pass the mod-31 check.
+        block = arr[start:end + 1]
+        hits = np.flatnonzero(block[:end - start] == 0x78)
+        hits = hits[np.isin(block[hits + 1], np.array([0x01, 0x5E, 0x9C, 0xDA], dtype=np.uint8))]
+        return (hits + start).tolist()
+    
+    def _validate_offsets(self, mm, offsets):
+        """Return image entries for the zlib candidates that decode to DAT images"""
+        file_size = len(mm)
+        images = []
+        
+        # Feed the decompressors slices of a view over the mapping rather
+        # than copying each candidate's bytes out of it
+        with memoryview(mm) as view:
+            for zpos in offsets:
                 if self.cancelled:
                     break
                 
-                if progress_callback and i % 500 == 0:
-                    pct = 25 + int(i * 75 / total_headers)
-                    progress_callback(pct, f"Analyzing {i:,}/{total_headers:,} blocks... {len(self.images)} images found")
-                
                 try:
+                    # Inflate only the DAT header first; almost every candidate is
+                    # rejected here without decompressing the whole block
+                    probe = _zlib.decompressobj()
+                    head = probe.decompress(view[zpos:zpos + self.PROBE_SIZE], DATImage.HEADER_SIZE)
+                    
+                    if len(head) >= DATImage.HEADER_SIZE:
+                        _, w, h, _, _ = _VAL.unpack_from(head)
+                        if not _dims_plausible(w, h):
+                            continue
+                    elif probe.eof:
+                        continue
+                    
                     chunk_end = min(zpos + 5000000, file_size)
-                    chunk = mm[zpos:chunk_end]
+                    chunk = view[zpos:chunk_end]
                     
-                    decompressor = zlib.decompressobj()
+                    decompressor = _zlib.decompressobj()
                     decompressed = decompressor.decompress(chunk, 20000000)
                     
                     if len(decompressed) >= 32:
-                        w = struct.unpack('<H', decompressed[0x0C:0x0E])[0]
-                        h = struct.unpack('<H', decompressed[0x0E:0x10])[0]
-                        ds = struct.unpack('<I', decompressed[0x08:0x0C])[0]
-                        format_flag = struct.unpack('<I', decompressed[0x10:0x14])[0]
-                        chroma_flag = struct.unpack('<H', decompressed[0x1C:0x1E])[0]
+                        ds, w, h, format_flag, chroma_flag = _VAL.unpack_from(decompressed)
                         
-                        if 2 <= w <= 8192 and 2 <= h <= 8192:
-                            expected_bgr = w * h * 3
-                            expected_bgra = w * h * 4
-                            actual_data = len(decompressed) - 32
+                        if _is_dat_header(ds, w, h, len(decompressed) - 32):
+                            compressed_size = len(chunk) - len(decompressor.unused_data)
                             
-                            if (abs(ds - expected_bgr) <= expected_bgr * 0.3 or
-                                abs(ds - expected_bgra) <= expected_bgra * 0.3 or
-                                abs(actual_data - expected_bgr) <= expected_bgr * 0.3 or
-                                abs(actual_data - expected_bgra) <= expected_bgra * 0.3):
-                                
-                                compressed_size = len(chunk) - len(decompressor.unused_data)
-                                
-                                self.images.append({
-                                    'offset': zpos,
-                                    'compressed_size': compressed_size,
-                                    'decompressed_size': len(decompressed),
-                                    'width': w,
-                                    'height': h,
-                                    'data_size': ds,
-                                    'format_flag': format_flag,
-                                    'chroma_flag': chroma_flag,
-                                    'type': 'image'
-                                })
+                            images.append({
+                                'offset': zpos,
+                                'compressed_size': compressed_size,
+                                'decompressed_size': len(decompressed),
+                                'width': w,
+                                'height': h,
+                                'data_size': ds,
+                                'format_flag': format_flag,
+                                'chroma_flag': chroma_flag,
+                                'type': 'image'
+                            })
                 
-                except (zlib.error, struct.error):
+                except (_zlib.error, struct.error):
                     pass
                 except Exception:
                     pass
-            
-            mm.close()
-        
-        self.complete = True
-        elapsed = time.time() - start_time
-        
-        if progress_callback:
-            progress_callback(100, f"Complete! Found {len(self.images)} images in {elapsed:.1f}s")
         
-        return self.images
+        return images
     
     def get_raw_data(self, index):
         """Get raw decompressed data for an image"""
@@ -451,19 +661,23 @@ class ImageScanner:
             return None
         
         img_info = self.images[index]
+        offset = img_info['offset']
         
-        with open(self.filepath, 'rb') as f:
-            f.seek(img_info['offset'])
-            compressed = f.read(img_info['compressed_size'] + 1000)
-        
+        # compressed_size covers the whole stream, so decompress straight from the mapping
+        # (a missing or emptied file fails to map and is treated like bad data)
         try:
-            return zlib.decompress(compressed)
+            mm = self.open_mmap()
+            with memoryview(mm)[offset:offset + img_info['compressed_size']] as compressed:
+                return _zlib.decompress(compressed)
         except:
             return None
     
     def get_image(self, index, force_flip=None):
         """Extract and decode a single image"""
-        data = self.get_raw_data(index)
+        return self.decode_image(self.get_raw_data(index), index, force_flip)
+    
+    def decode_image(self, data, index, force_flip=None):
+        """Decode raw data already extracted for an image"""
         if data is None:
             return None, None
         
@@ -494,6 +708,14 @@ class ImageScanner:
 
 class AssetBrowserApp:
     """GUI Application for browsing and exporting EXE assets"""
+    LIST_PAGE_SIZE = 500  # Image list rows inserted per lazy-load step
+    TILE_SIZE = 256  # Screen pixels per side of a zoomed-in preview tile
+    TILE_CACHE_SIZE = 64  # Scaled tiles kept while panning at one zoom level
+    PHOTO_CACHE_SIZE = 4  # Rendered previews kept for recently used zoom levels
+    PHOTO_CACHE_PIXELS = 16 << 20  # Total pixel limit of those previews
+    EXTRACT_CACHE_SIZE = 32  # Decompressed archive files kept for re-previewing
+    EXTRACT_CACHE_BYTES = 64 << 20  # Total size limit of those files
+    EXTRACT_CACHE_MAX_ENTRY = 8 << 20  # Larger files are never kept
     
     def __init__(self, root):
         self.root = root
@@ -509,6 +731,32 @@ class AssetBrowserApp:
         self.scan_thread = None
         self.filepath = None
         
+        # Checkerboard background reused across redraws of the same size
+        self._cb_cache_size = None
+        self._cb_cache_img = None
+        self._is_opaque = False
+        
+        # The shown photo's (rounded zoom, draft) key, so pans only move it, and
+        # full-quality photos of the current image by rounded zoom with their pixel
+        # counts, so returning to a recent zoom level reuses its photo
+        self._shown_key = None
+        self._photo_cache = OrderedDict()
+        self._photo_cache_pixels = 0
+        self._photo_source = None
+        self._img_id = None
+        
+        # Halving pyramid of the current image used as the source when zoomed out
+        self._pyramid = None
+        
+        # RGBA version of the current image, converted once per selection
+        self._rgba_image = None
+        
+        # Tiled drawing for zoomed-in views much larger than the canvas
+        self._tile_source = None
+        self._tile_photos = OrderedDict()
+        self._tile_items = {}
+        self._tile_zoom = None
+        
         # Zoom and pan state
         self.zoom_level = 1.0
         self.pan_x = 0
@@ -516,6 +764,28 @@ class AssetBrowserApp:
         self.drag_start_x = 0
         self.drag_start_y = 0
         self.is_dragging = False
+        self._redraw_pending = False
+        self._interacting = False
+        self._settle_id = None
+        
+        # Decompressed archive files from recent previews, oldest first
+        self._extract_lru = OrderedDict()
+        self._extract_lru_bytes = 0
+        
+        # Filtered image list indices and how many are inserted into the Treeview
+        self._list_images = []
+        self._list_matches = np.empty(0, dtype=np.intp)
+        self._list_loaded = 0
+        
+        # Width, height and decompressed size columns of the image index for filtering
+        self._img_w = np.empty(0, dtype=np.int64)
+        self._img_h = np.empty(0, dtype=np.int64)
+        self._img_sz = np.empty(0, dtype=np.int64)
+        
+        # Background image decoding for the preview
+        self._preview_request = 0
+        self._preview_queue = queue.Queue()
+        threading.Thread(target=self._preview_worker, daemon=True).start()
         
         self.setup_style()
         self.setup_ui()
@@ -635,11 +905,11 @@ class AssetBrowserApp:
         self.image_tree.column('format', width=70, anchor='c')
         self.image_tree.column('offset', width=90, anchor='e')
         
-        img_scrollbar = ttk.Scrollbar(img_tree_frame, orient=tk.VERTICAL, command=self.image_tree.yview)
-        self.image_tree.configure(yscrollcommand=img_scrollbar.set)
+        self.img_scrollbar = ttk.Scrollbar(img_tree_frame, orient=tk.VERTICAL, command=self.image_tree.yview)
+        self.image_tree.configure(yscrollcommand=self.on_image_list_scroll)
         
         self.image_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        img_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.img_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
         self.image_tree.bind('<<TreeviewSelect>>', self.on_image_select)
         
@@ -766,8 +1036,12 @@ class AssetBrowserApp:
             return
         
         self.filepath = filepath
+        if self.image_scanner:
+            self.image_scanner.close()
         self.image_scanner = ImageScanner(filepath)
         self.stub_archive = StubArchive(filepath)
+        self._extract_lru.clear()
+        self._extract_lru_bytes = 0
         
         # Scan stub archive first (fast)
         self.status_var.set("Scanning stub archive...")
@@ -795,73 +1069,48 @@ class AssetBrowserApp:
             self.archive_count_label.configure(text="No archive files found")
             return
         
-        # Build folder structure
-        folders = {}
+        # Build a folder trie; each node is (subfolders by name, [(name, file_info)])
+        root = ({}, [])
         
         for file_info in self.stub_archive.files:
-            filename = file_info['filename']
-            parts = filename.replace('\\', '/').split('/')
+            *dirs, name = file_info['filename'].replace('\\', '/').split('/')
             
-            if len(parts) == 1:
-                # Root level file
-                folder_key = ''
-            else:
-                folder_key = '/'.join(parts[:-1])
+            node = root
+            for part in dirs:
+                child = node[0].get(part)
+                if child is None:
+                    child = node[0][part] = ({}, [])
+                node = child
+            node[1].append((name, file_info))
+        
+        # Walk the trie, inserting each folder's subfolders (sorted) and then its
+        # files in one bulk_insert batch; only top-level folders start expanded
+        # so the initial layout stays small
+        pending = [(root, '')]
+        folder_count = 0
+        
+        while pending:
+            (subfolders, files), parent = pending.pop()
+            rows = []
             
-            if folder_key not in folders:
-                folders[folder_key] = []
-            folders[folder_key].append(file_info)
-        
-        # Create folder nodes
-        folder_nodes = {'': ''}
-        
-        for folder_path in sorted(folders.keys()):
-            if folder_path == '':
-                continue
-            
-            parts = folder_path.split('/')
-            current_path = ''
-            parent = ''
+            for part in sorted(subfolders):
+                folder_count += 1
+                iid = f"dir_{folder_count}"
+                rows.append((iid, ('', '', '', ''), '-text', f"[dir] {part}", '-open', parent == ''))
+                pending.append((subfolders[part], iid))
             
-            for part in parts:
-                current_path = f"{current_path}/{part}" if current_path else part
+            for filename, file_info in files:
+                # Short ASCII tag by extension
+                tag = _ARCHIVE_TAGS.get(os.path.splitext(filename)[1].lower(), 'file')
                 
-                if current_path not in folder_nodes:
-                    folder_nodes[current_path] = self.archive_tree.insert(
-                        folder_nodes[parent], 'end', text=f"📁 {part}",
-                        values=('', '', '', ''), open=True
-                    )
-                parent = current_path
-        
-        # Add files to folders
-        for folder_path, files in folders.items():
-            parent_node = folder_nodes.get(folder_path, '')
+                rows.append((f"arch_{file_info['index']}", (
+                    filename,
+                    f"{file_info['compressed_size']:,}",
+                    f"{file_info['compressed_size']:,}",
+                    f"0x{file_info['data_offset']:X}"
+                ), '-text', f"[{tag}] {filename}"))
             
-            for file_info in files:
-                filename = file_info['filename'].split('/')[-1].split('\\')[-1]
-                
-                # Get extension for icon
-                ext = Path(filename).suffix.lower()
-                if ext in ['.dll', '.exe']:
-                    icon = "⚙️"
-                elif ext in ['.ift', '.mfx']:
-                    icon = "🔌"
-                elif ext in ['.mvx', '.ccn']:
-                    icon = "🎮"
-                else:
-                    icon = "📄"
-                
-                self.archive_tree.insert(
-                    parent_node, 'end', 
-                    iid=f"arch_{file_info['index']}",
-                    text=f"{icon} {filename}",
-                    values=(
-                        filename,
-                        f"{file_info['compressed_size']:,}",
-                        f"{file_info['compressed_size']:,}",
-                        f"0x{file_info['data_offset']:X}"
-                    )
-                )
+            self.bulk_insert(self.archive_tree, rows, parent)
         
         self.archive_count_label.configure(text=f"{len(self.stub_archive.files)} archive files")
     
@@ -884,7 +1133,24 @@ class AssetBrowserApp:
             return
         
         file_info = self.stub_archive.files[index]
-        data = self.stub_archive.extract_file(index)
+        
+        # Drop any image decode still in flight so it can't replace this preview
+        self._preview_request += 1
+        
+        # Recently previewed files are kept decompressed so clicking back is instant
+        data = self._extract_lru.get(index)
+        if data is None:
+            data = self.stub_archive.extract_file(index)
+            
+            # Big entries (game data, DLLs) are not kept; the rest share a byte budget
+            if data is not None and len(data) <= self.EXTRACT_CACHE_MAX_ENTRY:
+                self._extract_lru[index] = data
+                self._extract_lru_bytes += len(data)
+                while (len(self._extract_lru) > self.EXTRACT_CACHE_SIZE
+                       or self._extract_lru_bytes > self.EXTRACT_CACHE_BYTES):
+                    self._extract_lru_bytes -= len(self._extract_lru.popitem(last=False)[1])
+        else:
+            self._extract_lru.move_to_end(index)
         
         self.current_raw_data = data
         self.current_dat = None
@@ -901,9 +1167,11 @@ class AssetBrowserApp:
         info.append(f"")
         info.append(f"First 64 bytes (hex):")
         
-        for i in range(0, min(64, len(data)), 16):
-            hex_str = ' '.join(f'{data[j]:02X}' for j in range(i, min(i+16, len(data))))
-            ascii_str = ''.join(chr(data[j]) if 32 <= data[j] < 127 else '.' for j in range(i, min(i+16, len(data))))
+        chunk = data[:64]
+        for i in range(0, len(chunk), 16):
+            row = chunk[i:i+16]
+            hex_str = row.hex(' ').upper()
+            ascii_str = row.translate(_PRINTABLE).decode('latin-1')
             info.append(f"  {i:04X}: {hex_str:<48} {ascii_str}")
         
         self.info_text.insert(tk.END, '\n'.join(info))
@@ -924,7 +1192,10 @@ class AssetBrowserApp:
         
         self.image_scanner.images = []
         self.image_scanner.complete = False
+        self._preview_request += 1
         self.image_tree.delete(*self.image_tree.get_children())
+        self._list_matches = np.empty(0, dtype=np.intp)
+        self._list_loaded = 0
         
         self.start_scan(cache_path)
     
@@ -941,15 +1212,27 @@ class AssetBrowserApp:
     
     def run_scan(self, cache_path):
         """Run scan in background thread"""
+        last_percent = -1
+        
         def progress_callback(percent, status):
-            self.progress_var.set(percent)
-            self.root.after(0, lambda: self.progress_label.configure(text=status))
+            # Tk calls belong on the main thread; skip updates until the percentage moves
+            # (the final 100% message always goes through)
+            nonlocal last_percent
+            percent = int(percent)
+            if percent == last_percent and percent < 100:
+                return
+            last_percent = percent
+            self.root.after(0, self.show_scan_progress, percent, status)
         
         self.image_scanner.scan(progress_callback)
         
         if self.image_scanner.complete and self.image_scanner.images:
             self.image_scanner.save_cache(cache_path)
     
+    def show_scan_progress(self, percent, status):
+        self.progress_var.set(percent)
+        self.progress_label.configure(text=status)
+    
     def check_scan_progress(self):
         """Check scan progress and update UI"""
         if self.image_scanner and self.image_scanner.complete:
@@ -962,6 +1245,16 @@ class AssetBrowserApp:
         else:
             self.root.after(100, self.check_scan_progress)
     
+    def bulk_insert(self, tree, rows, parent=''):
+        """Insert (iid, values, *options) rows into a Treeview in one batch"""
+        # Call the Tcl insert command directly; Treeview.insert rebuilds its
+        # option list in Python for every row, which dominates large lists.
+        # Any trailing row items are extra Tcl option/value pairs ('-text', ...).
+        call = tree.tk.call
+        path = str(tree)
+        for iid, values, *options in rows:
+            call(path, 'insert', parent, 'end', '-id', iid, '-values', values, *options)
+    
     def populate_image_list(self):
         """Populate the image list with filtering"""
         self.image_tree.delete(*self.image_tree.get_children())
@@ -984,30 +1277,45 @@ class AssetBrowserApp:
         except:
             min_size = 0
         
-        displayed = 0
-        for i, img in enumerate(self.image_scanner.images):
-            if img['width'] < min_width or img['height'] < min_height:
-                continue
-            if img['decompressed_size'] < min_size:
-                continue
-            
-            dims = f"{img['width']}x{img['height']}"
-            size = f"{img['decompressed_size']:,}"
-            
-            # Format indicator
-            fmt_parts = []
-            if img.get('chroma_flag') == 0x8000:
-                fmt_parts.append("CK")
-            if img.get('format_flag') == 0x1004:
-                fmt_parts.append("FL")
-            fmt = "+".join(fmt_parts) if fmt_parts else "STD"
-            
-            offset = f"0x{img['offset']:X}"
-            
-            self.image_tree.insert('', 'end', iid=str(i), values=(i, dims, size, fmt, offset))
-            displayed += 1
+        images = self.image_scanner.images
+        if self._list_images is not images or len(self._img_w) != len(images):
+            # Filter columns, rebuilt only when a new image index is loaded
+            self._list_images = images
+            count = len(images)
+            self._img_w = np.fromiter((img['width'] for img in images), dtype=np.int64, count=count)
+            self._img_h = np.fromiter((img['height'] for img in images), dtype=np.int64, count=count)
+            self._img_sz = np.fromiter((img['decompressed_size'] for img in images), dtype=np.int64, count=count)
+        
+        mask = (self._img_w >= min_width) & (self._img_h >= min_height) & (self._img_sz >= min_size)
+        self._list_matches = np.flatnonzero(mask)
+        self._list_loaded = 0
         
-        self.image_count_label.configure(text=f"Showing {displayed:,} of {len(self.image_scanner.images):,} images")
+        # Only the first page goes into the Treeview; the rest loads on scroll
+        self.load_more_images()
+        
+        self.image_count_label.configure(text=f"Showing {len(self._list_matches):,} of {len(images):,} images")
+    
+    def load_more_images(self):
+        """Append the next page of filtered images to the image list"""
+        start = self._list_loaded
+        end = min(start + self.LIST_PAGE_SIZE, len(self._list_matches))
+        images = self._list_images
+        
+        rows = []
+        for i in self._list_matches[start:end].tolist():
+            img = images[i]
+            fmt = _FORMAT_LABELS[img.get('chroma_flag') == 0x8000, img.get('format_flag') == 0x1004]
+            rows.append((str(i), (i, f"{img['width']}x{img['height']}", f"{img['decompressed_size']:,}",
+                                  fmt, f"0x{img['offset']:X}")))
+        
+        self.bulk_insert(self.image_tree, rows)
+        self._list_loaded = end
+    
+    def on_image_list_scroll(self, first, last):
+        """Update the scrollbar and load another page once the view nears the end"""
+        self.img_scrollbar.set(first, last)
+        if float(last) >= 0.9 and self._list_loaded < len(self._list_matches):
+            self.load_more_images()
     
     def apply_filter(self):
         """Apply filter and refresh list"""
@@ -1038,12 +1346,44 @@ class AssetBrowserApp:
             return
         
         self.status_var.set(f"Loading image {index}...")
-        self.root.update()
         
-        # Get raw data for potential export
-        self.current_raw_data = self.image_scanner.get_raw_data(index)
+        # Decode on the preview worker; the result comes back via _install_preview
+        self._preview_request += 1
+        self._preview_queue.put((self._preview_request, self.image_scanner, index, self.get_flip_setting()))
+    
+    def _preview_worker(self):
+        """Decode selected images in the background, always serving the newest request"""
+        while True:
+            job = self._preview_queue.get()
+            
+            # Selections that were superseded while we were busy are skipped
+            while True:
+                try:
+                    job = self._preview_queue.get_nowait()
+                except queue.Empty:
+                    break
+            
+            request_id, scanner, index, flip = job
+            
+            # Get raw data for potential export and decode those same bytes; decode
+            # errors are reported by decode_image, and anything else is shown as a
+            # decode error rather than ending the only worker thread
+            try:
+                raw_data = scanner.get_raw_data(index)
+                result = scanner.decode_image(raw_data, index, force_flip=flip)
+            except Exception as e:
+                print(f"Error loading image {index}: {e}")
+                raw_data, result = None, (None, None)
+            
+            self.root.after(0, self._install_preview, request_id, scanner, index, raw_data, result)
+    
+    def _install_preview(self, request_id, scanner, index, raw_data, result):
+        """Show a decoded image on the Tk thread unless a newer request is pending"""
+        if (request_id != self._preview_request or scanner is not self.image_scanner
+                or index >= len(scanner.images)):
+            return
         
-        result = self.image_scanner.get_image(index, force_flip=self.get_flip_setting())
+        self.current_raw_data = raw_data
         
         if result[0] is None:
             self.info_text.delete(1.0, tk.END)
@@ -1056,6 +1396,11 @@ class AssetBrowserApp:
         self.current_image = image
         self.current_dat = dat
         self.current_index = index
+        self._rgba_image = image if image.mode == 'RGBA' else image.convert('RGBA')
+        
+        # Checked once per image so redraws can skip the checkerboard composite
+        self._is_opaque = ('A' not in image.getbands() or
+                           image.getchannel('A').getextrema() == (255, 255))
         
         # Reset zoom and pan for new image
         self.zoom_level = 1.0
@@ -1087,9 +1432,6 @@ class AssetBrowserApp:
     
     def display_image(self, image):
         """Display an image on the canvas with zoom and pan"""
-        if image.mode != 'RGBA':
-            image = image.convert('RGBA')
-        
         canvas_width = self.canvas.winfo_width()
         canvas_height = self.canvas.winfo_height()
         
@@ -1098,47 +1440,203 @@ class AssetBrowserApp:
         if canvas_height < 10:
             canvas_height = 600
         
-        # Apply zoom
-        img_width, img_height = image.size
+        x = canvas_width // 2 + self.pan_x
+        y = canvas_height // 2 + self.pan_y
+        
+        # Downscales use NEAREST mid-gesture; the settle redraw replaces the draft with LANCZOS
+        draft = self._interacting and self.zoom_level <= 1
+        
+        if self._photo_source is not self._rgba_image:
+            self._photo_source = self._rgba_image
+            self._photo_cache.clear()
+            self._photo_cache_pixels = 0
+            self._shown_key = None
+        
+        # Already showing this zoom (e.g. while panning): just move the photo instead of
+        # resizing and compositing again; a draft only stands in until the settle redraw
+        zoom_key = round(self.zoom_level, 3)
+        shown = self._shown_key
+        if (shown is not None and shown[0] == zoom_key and (draft or not shown[1])
+                and self.canvas.type(self._img_id)):
+            self.canvas.coords(self._img_id, x, y)
+            return
+        
+        # Rendered at this zoom recently: show that photo again
+        cached = self._photo_cache.get(zoom_key)
+        if cached is not None:
+            self._photo_cache.move_to_end(zoom_key)
+            self.show_photo(cached[0], x, y, (zoom_key, False))
+            return
+        
+        source = image
+        
+        # Apply zoom, resampling from the nearest pre-reduced level when zoomed out
+        img_width, img_height = source.size
         new_width = max(1, int(img_width * self.zoom_level))
         new_height = max(1, int(img_height * self.zoom_level))
         
-        if new_width != img_width or new_height != img_height:
-            resample = Image.Resampling.NEAREST if self.zoom_level > 1 else Image.Resampling.LANCZOS
-            display_image = image.resize((new_width, new_height), resample)
+        # Zoomed in far past the canvas: only render the tiles that are on screen
+        if self.zoom_level > 1 and new_width * new_height > 4 * canvas_width * canvas_height:
+            self.display_tiles(source, new_width, new_height, x, y, canvas_width, canvas_height)
+            return
+        
+        image = self.get_pyramid_level(self._rgba_image)
+        
+        if (new_width, new_height) != image.size:
+            resample = Image.Resampling.NEAREST if self.zoom_level > 1 or draft else Image.Resampling.LANCZOS
+            # The pyramid leaves less than a 2x step for most images; reducing_gap covers the
+            # larger leftover factor when it stopped early (thin images at low zoom)
+            display_image = image.resize((new_width, new_height), resample, reducing_gap=2.0)
         else:
             display_image = image
         
-        # Checkerboard background for transparency
-        bg = self.create_checkerboard(display_image.size)
-        composite = Image.alpha_composite(bg, display_image)
-        
-        self.photo_image = ImageTk.PhotoImage(composite)
+        if self._is_opaque:
+            # Nothing shows through, so skip the background entirely
+            composite = display_image
+        else:
+            # Checkerboard background for transparency, rebuilt only when the size changes
+            # (alpha_composite returns a new image, so the cached board is never modified)
+            if self._cb_cache_size != display_image.size:
+                self._cb_cache_img = self.create_checkerboard(display_image.size)
+                self._cb_cache_size = display_image.size
+            composite = Image.alpha_composite(self._cb_cache_img, display_image)
+        
+        photo = ImageTk.PhotoImage(composite)
+        
+        # Drafts are never kept, and neither is anything too big for the budget;
+        # the shown photo still serves pans at its zoom either way
+        pixels = composite.size[0] * composite.size[1]
+        if not draft and pixels <= self.PHOTO_CACHE_PIXELS:
+            self._photo_cache[zoom_key] = (photo, pixels)
+            self._photo_cache_pixels += pixels
+            while (len(self._photo_cache) > self.PHOTO_CACHE_SIZE
+                   or self._photo_cache_pixels > self.PHOTO_CACHE_PIXELS):
+                self._photo_cache_pixels -= self._photo_cache.popitem(last=False)[1][1]
+        
+        self.show_photo(photo, x, y, (zoom_key, draft))
+    
+    def show_photo(self, photo, x, y, key):
+        """Replace the canvas contents with a single photo centered at x, y"""
+        self.photo_image = photo
+        self._shown_key = key
         
         self.canvas.delete("all")
+        self._tile_items = {}
+        self._tile_zoom = None
         
-        x = canvas_width // 2 + self.pan_x
-        y = canvas_height // 2 + self.pan_y
+        self._img_id = self.canvas.create_image(x, y, image=photo, anchor=tk.CENTER)
+    
+    def display_tiles(self, source, new_width, new_height, x, y, canvas_width, canvas_height):
+        """Draw only the zoomed tiles of source that intersect the canvas"""
+        zoom = self.zoom_level
+        img_width, img_height = source.size
+        
+        # Source pixels per tile, so each scaled tile is about TILE_SIZE on screen
+        ts = math.ceil(self.TILE_SIZE / zoom)
+        
+        # Tiles are only valid for one image at one zoom level
+        if self._tile_source is not source or self._tile_zoom != zoom:
+            self._tile_source = source
+            self._tile_photos.clear()
+            self.canvas.delete("all")
+            self._img_id = None
+            self._tile_items = {}
+            self._tile_zoom = zoom
+        
+        # Top-left of the zoomed image on the canvas, matching a centered create_image
+        left = x - new_width // 2
+        top = y - new_height // 2
+        
+        # Visible rectangle in source pixel coordinates
+        ix0 = max(0, int(-left / zoom))
+        iy0 = max(0, int(-top / zoom))
+        ix1 = min(img_width, int((canvas_width - left) / zoom) + 1)
+        iy1 = min(img_height, int((canvas_height - top) / zoom) + 1)
+        
+        cols = range(ix0 // ts, -(-ix1 // ts)) if ix1 > ix0 else range(0)
+        rows = range(iy0 // ts, -(-iy1 // ts)) if iy1 > iy0 else range(0)
+        
+        visible = set()
+        for ty in rows:
+            for tx in cols:
+                key = (tx, ty)
+                visible.add(key)
+                
+                # Tile edges in zoomed pixels, so neighbouring tiles meet without gaps
+                sx0 = tx * ts * new_width // img_width
+                sy0 = ty * ts * new_height // img_height
+                
+                photo = self._tile_photos.get(key)
+                if photo is None:
+                    photo = self.render_tile(tx, ty, ts, new_width, new_height)
+                    self._tile_photos[key] = photo
+                else:
+                    self._tile_photos.move_to_end(key)
+                
+                item = self._tile_items.get(key)
+                if item is not None and self.canvas.type(item):
+                    self.canvas.coords(item, left + sx0, top + sy0)
+                else:
+                    self._tile_items[key] = self.canvas.create_image(
+                        left + sx0, top + sy0, image=photo, anchor=tk.NW)
+        
+        for key in [k for k in self._tile_items if k not in visible]:
+            self.canvas.delete(self._tile_items.pop(key))
         
-        self.canvas.create_image(x, y, image=self.photo_image, anchor=tk.CENTER)
+        # Visible tiles were just moved to the end, so eviction never drops one on screen
+        while len(self._tile_photos) > max(self.TILE_CACHE_SIZE, len(visible)):
+            self._tile_photos.popitem(last=False)
     
-    def create_checkerboard(self, size, block_size=8):
+    def render_tile(self, tx, ty, ts, new_width, new_height):
+        """Scale and composite one ts-sized source tile into a PhotoImage"""
+        img_width, img_height = self._rgba_image.size
+        box = (tx * ts, ty * ts, min((tx + 1) * ts, img_width), min((ty + 1) * ts, img_height))
+        
+        sx0 = tx * ts * new_width // img_width
+        sy0 = ty * ts * new_height // img_height
+        sx1 = min((tx + 1) * ts, img_width) * new_width // img_width
+        sy1 = min((ty + 1) * ts, img_height) * new_height // img_height
+        
+        scaled = self._rgba_image.resize((sx1 - sx0, sy1 - sy0), Image.Resampling.NEAREST, box=box)
+        if not self._is_opaque:
+            # Offset the board so its squares line up across tile boundaries
+            board = self.create_checkerboard(scaled.size, offset=(sx0, sy0))
+            scaled = Image.alpha_composite(board, scaled)
+        
+        return ImageTk.PhotoImage(scaled)
+    
+    def get_pyramid_level(self, image):
+        """Return the smallest halving of image that is still no smaller than the zoomed size"""
+        if self._pyramid is None or self._pyramid[0] is not image:
+            self._pyramid = [image]
+        
+        level = int(math.log2(1 / self.zoom_level)) if self.zoom_level < 1 else 0
+        
+        # Levels are built on first use and kept while the image stays selected
+        while len(self._pyramid) <= level and min(self._pyramid[-1].size) >= 128:
+            self._pyramid.append(self._pyramid[-1].reduce(2))
+        
+        return self._pyramid[min(level, len(self._pyramid) - 1)]
+    
+    def create_checkerboard(self, size, block_size=8, offset=(0, 0)):
         """Create checkerboard background for transparency display"""
         w, h = size
-        img = Image.new('RGBA', (w, h))
-        pixels = img.load()
+        b = block_size
+        ox = offset[0] % (2 * b)
+        oy = offset[1] % (2 * b)
         
         c1 = (100, 100, 100, 255)
         c2 = (150, 150, 150, 255)
         
-        for y in range(h):
-            for x in range(w):
-                if ((x // block_size) + (y // block_size)) % 2 == 0:
-                    pixels[x, y] = c1
-                else:
-                    pixels[x, y] = c2
+        # Build one 2x2-block tile and repeat it across the image
+        tile = np.empty((2 * b, 2 * b, 4), dtype=np.uint8)
+        tile[:b, :b] = c1
+        tile[b:, b:] = c1
+        tile[:b, b:] = c2
+        tile[b:, :b] = c2
         
-        return img
+        board = np.tile(tile, ((h + oy) // (2 * b) + 1, (w + ox) // (2 * b) + 1, 1))[oy:oy + h, ox:ox + w]
+        return Image.fromarray(np.ascontiguousarray(board))
     
     # Zoom and Pan Methods
     def zoom_in(self):
@@ -1181,8 +1679,22 @@ class AssetBrowserApp:
         self.pan_y = 0
         self.update_zoom_display()
     
-    def update_zoom_display(self):
+    def update_zoom_display(self, deferred=False):
         self.zoom_label.configure(text=f"{int(self.zoom_level * 100)}%")
+        if self.current_image:
+            if deferred:
+                self.schedule_redraw()
+            else:
+                self.display_image(self.current_image)
+    
+    def schedule_redraw(self):
+        """Coalesce redraw requests into one display_image call per idle cycle"""
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.root.after_idle(self._do_redraw)
+    
+    def _do_redraw(self):
+        self._redraw_pending = False
         if self.current_image:
             self.display_image(self.current_image)
     
@@ -1191,9 +1703,31 @@ class AssetBrowserApp:
             self.zoom_level = min(10.0, self.zoom_level * 1.1)
         elif event.num == 5 or event.delta < 0:
             self.zoom_level = max(0.1, self.zoom_level / 1.1)
-        self.update_zoom_display()
+        self.begin_interaction()
+        self.update_zoom_display(deferred=True)
+        self.schedule_settle()
+    
+    def begin_interaction(self):
+        """Switch redraws to fast resampling until the gesture settles"""
+        self._interacting = True
+        if self._settle_id is not None:
+            self.root.after_cancel(self._settle_id)
+            self._settle_id = None
+    
+    def schedule_settle(self):
+        """Redraw at full quality once the view has been still for a moment"""
+        if self._settle_id is not None:
+            self.root.after_cancel(self._settle_id)
+        self._settle_id = self.root.after(150, self._settle_redraw)
+    
+    def _settle_redraw(self):
+        self._settle_id = None
+        self._interacting = False
+        if self.current_image:
+            self.display_image(self.current_image)
     
     def on_pan_start(self, event):
+        self.begin_interaction()
         self.is_dragging = True
         self.drag_start_x = event.x - self.pan_x
         self.drag_start_y = event.y - self.pan_y
@@ -1204,11 +1738,12 @@ class AssetBrowserApp:
             self.pan_x = event.x - self.drag_start_x
             self.pan_y = event.y - self.drag_start_y
             if self.current_image:
-                self.display_image(self.current_image)
+                self.schedule_redraw()
     
     def on_pan_end(self, event):
         self.is_dragging = False
         self.canvas.configure(cursor='')
+        self.schedule_settle()
     
     # Export Methods
     def export_selected_png(self):
@@ -1233,8 +1768,18 @@ class AssetBrowserApp:
         if not output_path:
             return
         
-        self.current_image.save(output_path, "PNG")
-        self.status_var.set(f"Exported: {output_path}")
+        # Encode on a worker thread; current_image is only ever replaced, never
+        # modified in place, so the worker can keep using this reference
+        self.status_var.set(f"Exporting: {output_path}")
+        threading.Thread(target=self._save_png, args=(self.current_image, output_path), daemon=True).start()
+    
+    def _save_png(self, image, output_path):
+        try:
+            image.save(output_path, "PNG")
+            status = f"Exported: {output_path}"
+        except Exception as e:
+            status = f"Export failed: {e}"
+        self.root.after(0, lambda: self.status_var.set(status))
     
     def export_selected_raw(self):
         """Export selected image as raw DAT data"""
@@ -1306,39 +1851,76 @@ class AssetBrowserApp:
         exported = 0
         errors = 0
         flip_setting = self.get_flip_setting()
+        images = self.image_scanner.images
         
-        for i, img_info in enumerate(self.image_scanner.images):
-            export_progress['value'] = i + 1
-            export_label.configure(text=f"Exporting {i+1}/{len(self.image_scanner.images)}...")
-            progress_win.update()
-            
+        def export_one(i, img_info):
+            """Write the files for one image, returning whether the counted export succeeded"""
             base_name = f"image_{i:04d}_{img_info['width']}x{img_info['height']}"
+            ok = False
             
-            if export_raw:
-                raw_data = self.image_scanner.get_raw_data(i)
-                if raw_data:
-                    with open(Path(output_dir) / f"{base_name}.dat", 'wb') as f:
-                        f.write(raw_data)
+            # Failures (unreadable data, disk errors) count as errors instead of
+            # aborting the batch while the remaining exports keep running
+            try:
+                if export_raw:
+                    raw_data = self.image_scanner.get_raw_data(i)
+                    if raw_data:
+                        with open(Path(output_dir) / f"{base_name}.dat", 'wb') as f:
+                            f.write(raw_data)
+                        ok = True
+                
+                if export_png:
+                    result = self.image_scanner.get_image(i, force_flip=flip_setting)
+                    if result[0]:
+                        # Fast zlib level: bulk exports trade slightly larger files for speed
+                        result[0].save(Path(output_dir) / f"{base_name}.png", "PNG", compress_level=3)
+                        if not export_raw:
+                            ok = True
+            except Exception as e:
+                print(f"Error exporting image {i}: {e}")
+            
+            return ok
+        
+        # Inflate, decode and PNG encoding release the GIL, so images export in parallel.
+        # Workers report through a queue that the Tk thread drains from an after() loop,
+        # so the dialog keeps repainting even while a slow image is still encoding.
+        results = queue.Queue()
+        executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+        for i, img_info in enumerate(images):
+            executor.submit(export_one, i, img_info).add_done_callback(
+                lambda future: results.put(future.result()))
+        executor.shutdown(wait=False)
+        
+        # The dialog closes itself once every image is accounted for
+        progress_win.protocol("WM_DELETE_WINDOW", lambda: None)
+        done = 0
+        
+        def poll_export():
+            nonlocal done, exported, errors
+            while True:
+                try:
+                    ok = results.get_nowait()
+                except queue.Empty:
+                    break
+                done += 1
+                if ok:
                     exported += 1
                 else:
                     errors += 1
             
-            if export_png:
-                result = self.image_scanner.get_image(i, force_flip=flip_setting)
-                if result[0]:
-                    result[0].save(Path(output_dir) / f"{base_name}.png", "PNG")
-                    if not export_raw:
-                        exported += 1
-                else:
-                    if not export_raw:
-                        errors += 1
-        
-        progress_win.destroy()
+            export_progress['value'] = done
+            export_label.configure(text=f"Exporting {done}/{len(images)}...")
+            if done < len(images):
+                self.root.after(50, poll_export)
+                return
+            
+            progress_win.destroy()
+            
+            fmt = "PNG" if export_png else "RAW DAT"
+            self.status_var.set(f"Export complete: {exported} {fmt} files, {errors} errors")
+            messagebox.showinfo("Export Complete", 
+                              f"Exported {exported} {fmt} files\nErrors: {errors}\n\nLocation: {output_dir}")
         
-        fmt = "PNG" if export_png else "RAW DAT"
-        self.status_var.set(f"Export complete: {exported} {fmt} files, {errors} errors")
-        messagebox.showinfo("Export Complete", 
-                          f"Exported {exported} {fmt} files\nErrors: {errors}\n\nLocation: {output_dir}")
+        poll_export()
     
     def export_all_archive(self):
         """Export all archive files with folder structure"""
@@ -1365,20 +1947,22 @@ class AssetBrowserApp:
         exported = 0
         errors = 0
         
+        last_refresh = 0
         for i, file_info in enumerate(self.stub_archive.files):
-            export_progress['value'] = i + 1
-            export_label.configure(text=f"Exporting {i+1}/{len(self.stub_archive.files)}...")
-            progress_win.update()
+            # Refresh the dialog at most every 50 ms rather than once per file
+            now = time.monotonic()
+            if now - last_refresh >= 0.05:
+                last_refresh = now
+                export_progress['value'] = i + 1
+                export_label.configure(text=f"Exporting {i+1}/{len(self.stub_archive.files)}...")
+                progress_win.update()
             
             filename = file_info['filename'].replace('\\', '/')
             output_path = Path(output_dir) / filename
             
             output_path.parent.mkdir(parents=True, exist_ok=True)
             
-            data = self.stub_archive.extract_file(i)
-            if data:
-                with open(output_path, 'wb') as f:
-                    f.write(data)
+            if self.stub_archive.extract_file_to(output_path, i):
                 exported += 1
             else:
                 errors += 1